@@ -4,7 +4,23 @@ import sys
 
 sys.path.append(os.path.abspath(".."))
 sys.path.append(os.path.abspath("../.."))
-from shared_conf import *
+from shared_conf import (  # noqa: E402
+    copyright,
+    default_role,
+    doctest_global_setup,
+    doctest_path,
+    exclude_trees,
+    extensions,
+    html_sidebars,
+    html_theme,
+    html_theme_options,
+    html_theme_path,
+    intersphinx_mapping,
+    master_doc,
+    project,
+    source_suffix,
+    templates_path,
+)
 
 # Enable autodoc, intersphinx
 extensions.extend(["sphinx.ext.autodoc"])
@@ -2,20 +2,31 @@
 Command-line completion mechanisms, executed by the core ``--complete`` flag.
 """
 
-import glob
 import os
-import re
-import shlex
+import sys
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from ..exceptions import Exit, ParseError
 from ..util import debug, task_name_sort_key
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ..collection import Collection
     from ..parser import Parser, ParserContext, ParseResult
 
 
+def _strip_program_name(remainder: str, names: list[str]) -> str:
+    # Longest names first, so e.g. 'invoke' wins over 'inv'.
+    for name in sorted(names, key=len, reverse=True):
+        prefix = name + " "
+        if remainder.startswith(prefix):
+            n = len(prefix)
+            return remainder[n:]
+    return remainder
+
+
 def complete(
     names: list[str],
     core: "ParseResult",
@@ -23,15 +34,18 @@ def complete(
     collection: "Collection",
     parser: "Parser",
 ) -> Exit:
+    # Deferred, as most runs never complete anything
+    import shlex
+
     # Strip out program name (scripts give us full command line)
     # TODO: this may not handle path/to/script though?
-    invocation = re.sub(r"^({}) ".format("|".join(names)), "", core.remainder)
+    invocation = _strip_program_name(core.remainder, names)
     debug("Completing for invocation: %r", invocation)
     # Tokenize (shlex will have to do)
     tokens = shlex.split(invocation)
+    tail = tokens[-1] if tokens else ""
     # Handle flags (partial or otherwise)
-    if tokens and tokens[-1].startswith("-"):
-        tail = tokens[-1]
+    if tail.startswith("-"):
         debug("Invocation's tail %r is flag-like", tail)
         # Gently parse invocation to obtain 'current' context.
         # Use last seen context in case of failure (required for
@@ -62,14 +76,12 @@ def complete(
             debug("Not found, completing with flag names")
             # Long flags - partial or just the dashes - complete w/ long flags
             if tail.startswith("--"):
-                for name in filter(
-                    lambda x: x.startswith("--"), context.flag_names()
-                ):
-                    print(name)
+                _print_lines(
+                    x for x in context._iter_flag_names() if x.startswith("--")
+                )
             # Just a dash, completes with all flags
             elif tail == "-":
-                for name in context.flag_names():
-                    print(name)
+                _print_lines(context._iter_flag_names())
             # Otherwise, it's something entirely invalid (a shortflag not
             # recognized, or a java style flag like -foo) so return nothing
             # (the shell will still try completing with files, but that doesn't
@@ -96,18 +108,30 @@ def complete(
 
 
 def print_task_names(collection: "Collection") -> None:
+    lines = []
     for name in sorted(collection.task_names, key=task_name_sort_key):
-        print(name)
+        lines.append(name)
         # Just stick aliases after the thing they're aliased to. Sorting isn't
         # so important that it's worth bending over backwards here.
-        for alias in collection.task_names[name]:
-            print(alias)
+        lines.extend(collection.task_names[name])
+    _print_lines(lines)
 
 
-def print_completion_script(shell: str, names: list[str]) -> None:
+def _print_lines(lines: "Iterable[str]") -> None:
+    # One write for the lot, instead of a print() per line
+    output = "\n".join(lines)
+    if output:
+        sys.stdout.write(output + "\n")
+
+
+@lru_cache(maxsize=1)
+def _completion_scripts() -> dict[str, str]:
     # Grab all .completion files in invoke/completion/. (These used to have no
-    # suffix, but surprise, that's super fragile.
-    completions = {
+    # suffix, but surprise, that's super fragile.) They ship with the package,
+    # so one directory scan per process is plenty.
+    import glob
+
+    return {
         os.path.splitext(os.path.basename(x))[0]: x
         for x in glob.glob(
             os.path.join(
@@ -115,6 +139,10 @@ def print_completion_script(shell: str, names: list[str]) -> None:
             )
         )
     }
+
+
+def print_completion_script(shell: str, names: list[str]) -> None:
+    completions = _completion_scripts()
     try:
         path = completions[shell]
     except KeyError as exc:
@@ -106,7 +106,7 @@ class Executor:
         direct = list(calls)
         # Expand pre/post tasks
         # TODO: may make sense to bundle expansion & deduping now eh?
-        expanded: list[Call] = self.expand_calls(calls)
+        expanded: list[Call] = self.expand_calls(list(calls))
         # Get some good value for dedupe option, even if config doesn't have
         # the tree we expect. (This is a concession to testing.)
         try:
@@ -195,7 +195,7 @@ class Executor:
                 debug("%r: found in list already, skipping", call)
         return deduped
 
-    def expand_calls(self, calls: list[Call]) -> list[Call]:
+    def expand_calls(self, calls: list[Union[Call, Task]]) -> list[Call]:
         """
         Expand a list of `.Call` objects into a near-final list of same.
 
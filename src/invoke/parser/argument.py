@@ -1,4 +1,4 @@
-from typing import Any, Iterable, Optional, Tuple
+from typing import Any, Iterable, Optional, Tuple, Union
 
 # TODO: dynamic type for kind
 # T = TypeVar('T')
@@ -39,6 +39,14 @@ class Argument:
     .. versionadded:: 1.0
     """
 
+    # Primary CLI flag (e.g. ``--foo-bar``); filled in by
+    # `.ParserContext.add_arg`.
+    _flag_name: str
+    # ``(names, key)`` memo for `.flag_key`; recomputed if ``names`` changes.
+    _flag_key_cache: Optional[
+        Tuple[Tuple[str, ...], list[Union[int, str]]]
+    ] = None
+
     def __init__(
         self,
         name: Optional[str] = None,
@@ -1,4 +1,4 @@
-import itertools
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional, Union
 
 from lexicon import Lexicon
@@ -6,11 +6,14 @@ from lexicon import Lexicon
 from .argument import Argument
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 
+# Memoized: the same handful of argument names get translated over and over
+# (per task in get_arguments, per flag in to_flag).
+@lru_cache(maxsize=1024)
 def translate_underscores(name: str) -> str:
-    return name.lstrip("_").rstrip("_").replace("_", "-")
+    return name.strip("_").replace("_", "-")
 
 
 def to_flag(name: str) -> str:
@@ -21,19 +24,27 @@ def to_flag(name: str) -> str:
 
 
 def sort_candidate(arg: Argument) -> str:
-    names = arg.names
-    # TODO: is there no "split into two buckets on predicate" builtin?
-    shorts = {x for x in names if len(x.strip("-")) == 1}
-    longs = {x for x in names if x not in shorts}
-    return str(sorted(shorts if shorts else longs)[0])
+    # Lowest short name if there are any, otherwise lowest name overall
+    # (which, absent shorts, is the lowest long name). min() rather than
+    # sorting, since only the first item is wanted.
+    shorts = [x for x in arg.names if len(x.strip("-")) == 1]
+    return str(min(shorts or arg.names))
 
 
 def flag_key(arg: Argument) -> list[Union[int, str]]:
     """
     Obtain useful key list-of-ints for sorting CLI flags.
 
+    The result is cached on the argument itself (keyed on its ``names``, so
+    a renamed argument is recomputed), since the same arguments get sorted
+    repeatedly by `ParserContext.help_tuples` and
+    `ParserContext.flag_names`.
+
     .. versionadded:: 1.0
     """
+    cached = arg._flag_key_cache
+    if cached is not None and cached[0] == arg.names:
+        return cached[1]
     # Setup
     ret: list[Union[int, str]] = []
     x = sort_candidate(arg)
@@ -47,10 +58,8 @@ def flag_key(arg: Argument) -> list[Union[int, str]]:
     ret.append(x.lower())
     # Finally, if the case-insensitive test also matched, compare
     # case-sensitive, but inverse (with lowercase letters coming first)
-    inversed = ""
-    for char in x:
-        inversed += char.lower() if char.isupper() else char.upper()
-    ret.append(inversed)
+    ret.append(x.swapcase())
+    arg._flag_key_cache = (arg.names, ret)
     return ret
 
 
@@ -91,7 +100,11 @@ class ParserContext:
         self.args = Lexicon()
         self.positional_args: list[Argument] = []
         self.flags = Lexicon()
-        self.inverse_flags: dict = {}  # No need for Lexicon here
+        # Maps e.g. '--no-foo' to '--foo'; the parser needs the mapping, not
+        # just the names. (No need for Lexicon here.)
+        self.inverse_flags: dict[str, str] = {}
+        # Reverse index of inverse_flags' values, for O(1) membership tests
+        self._inverse_flag_targets: set[str] = set()
         self.name = name
         self.aliases = aliases
         for arg in args:
@@ -142,10 +155,12 @@ class ParserContext:
         if arg.positional:
             self.positional_args.append(arg)
         # Add names & nicknames to flags, args
-        self.flags[to_flag(main)] = arg
+        flag = to_flag(main)
+        arg._flag_name = flag
+        self.flags[flag] = arg
         for name in arg.nicknames:
             self.args.alias(name, to=main)
-            self.flags.alias(to_flag(name), to=to_flag(main))
+            self.flags.alias(to_flag(name), to=flag)
         # Add attr_name to args, but not flags
         if arg.attr_name:
             self.args.alias(arg.attr_name, to=main)
@@ -155,10 +170,14 @@ class ParserContext:
             # of the primary argument name if underscore-to-dash transformation
             # occurred.
             inverse_name = to_flag(f"no-{main}")
-            self.inverse_flags[inverse_name] = to_flag(main)
+            self.inverse_flags[inverse_name] = flag
+            self._inverse_flag_targets.add(flag)
 
     @property
     def missing_positional_args(self) -> list[Argument]:
+        # Most contexts have no positional args at all
+        if not self.positional_args:
+            return []
         return [x for x in self.positional_args if x.value is None]
 
     @property
@@ -171,14 +190,17 @@ class ParserContext:
 
         .. versionadded:: 1.0
         """
-        ret = {}
-        for arg in self.args.values():
-            ret[arg.name] = arg.value
-        return ret
+        return {arg.name: arg.value for arg in self.args.values()}
 
     def names_for(self, flag: str) -> list[str]:
         # TODO: should probably be a method on Lexicon/Aliasdict
-        return list(set([flag] + self.flags.aliases_of(flag)))
+        aliases = self.flags.aliases_of(flag)
+        # Most flags have no aliases; skip the dedupe entirely then.
+        if not aliases:
+            return [flag]
+        # dict.fromkeys dedupes while keeping order (flag first), so output
+        # is stable across runs, unlike a set.
+        return list(dict.fromkeys([flag, *aliases]))
 
     def help_for(self, flag: str) -> tuple[str, str]:
         """
@@ -196,23 +218,29 @@ class ParserContext:
         arg = self.flags[flag]
         # Determine expected value type, if any
         value = {str: "STRING", int: "INT"}.get(arg.kind)
+        # Short flags are -f VAL, long are --foo=VAL
+        # When optional, also, -f [VAL] and --foo[=VAL]
+        # (These don't vary per name, so work them out up front.)
+        short_valuestr = long_valuestr = ""
+        if value:
+            if arg.optional:
+                short_valuestr = f" [{value}]"
+                long_valuestr = f"[={value}]"
+            else:
+                short_valuestr = f" {value}"
+                long_valuestr = f"={value}"
         # Format & go
         full_names = []
         for name in self.names_for(flag):
             if value:
-                # Short flags are -f VAL, long are --foo=VAL
-                # When optional, also, -f [VAL] and --foo[=VAL]
                 if len(name.strip("-")) == 1:
-                    value_ = f"[{value}]" if arg.optional else value
-                    valuestr = f" {value_}"
+                    valuestr = short_valuestr
                 else:
-                    valuestr = f"={value}"
-                    if arg.optional:
-                        valuestr = f"[{valuestr}]"
+                    valuestr = long_valuestr
             else:
                 # no value => boolean
                 # check for inverse
-                if name in self.inverse_flags.values():
+                if name in self._inverse_flag_targets:
                     name = f"--[no-]{name[2:]}"
                 valuestr = ""
             # Tack together
@@ -245,12 +273,11 @@ class ParserContext:
         .. versionadded:: 1.0
         """
         # TODO: argument/flag API must change :(
-        # having to call to_flag on 1st name of an Argument is just dumb.
         # To pass in an Argument object to help_for may require moderate
-        # changes?
+        # changes? Until then, use the flag name stashed by add_arg.
         return list(
             map(
-                lambda x: self.help_for(to_flag(x.name)),
+                lambda x: self.help_for(x._flag_name),
                 sorted(self.flags.values(), key=flag_key),
             )
         )
@@ -263,9 +290,12 @@ class ParserContext:
 
         .. versionadded:: 1.0
         """
+        return tuple(self._iter_flag_names())
+
+    def _iter_flag_names(self) -> "Iterator[str]":
+        # Lazy form of flag_names, for callers who only filter/stream it.
         # Regular flag names
-        flags = sorted(self.flags.values(), key=flag_key)
-        names = [self.names_for(to_flag(x.name)) for x in flags]
+        for x in sorted(self.flags.values(), key=flag_key):
+            yield from self.names_for(x._flag_name)
         # Inverse flag names sold separately
-        names.append(list(self.inverse_flags.keys()))
-        return tuple(itertools.chain.from_iterable(names))
+        yield from self.inverse_flags
@@ -6,9 +6,9 @@ generate new tasks.
 from __future__ import annotations
 
 import inspect
+import sys
 from collections.abc import Callable, Iterable
 from copy import deepcopy
-from functools import singledispatchmethod, update_wrapper
 from types import FunctionType
 from typing import (  # Generic,; TypeVar,
     TYPE_CHECKING,
@@ -29,6 +29,39 @@ if TYPE_CHECKING:
 
 # T = TypeVar("T", bound="Callable")
 
+# Keyword arguments understood by Task.__init__ ('klass' is for __new__).
+_TASK_OPTIONS = frozenset(
+    {
+        "name",
+        "aliases",
+        "default",
+        "optional",
+        "iterable",
+        "incrementable",
+        "auto_shortflags",
+        "help",
+        "pre",
+        "post",
+        "autoprint",
+        "positional",
+        "klass",
+    }
+)
+
+# Sentinel for "no default value" in inspect signatures
+_EMPTY = inspect.Parameter.empty
+
+# Types whose instances deepcopy() would hand back as-is anyway.
+_ATOMIC_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+
+def _copy_item(value: Any, memo: dict) -> Any:
+    # Skip deepcopy()'s dispatch overhead for the plain values that task
+    # (kw)args are nearly always made of.
+    if type(value) in _ATOMIC_TYPES:
+        return value
+    return deepcopy(value, memo)
+
 
 class Task:
     """
@@ -118,43 +151,48 @@ class Task:
             body = None
         # Real callable
         self.body = body
+        # (body, argspec(body)) memo; see argspec()
+        self._argspec: Optional[tuple[Callable, Signature]] = None
+        # (body, Argument kwargs) memo; see get_arguments()
+        self._arguments: Optional[tuple[Callable, list[dict]]] = None
+        self._hash: Optional[int] = None
+        self._resolved_name: Optional[str] = None
         if self.body:
-            # XXX: update_wrapper not working well here
-            update_wrapper(self, self.body)
-            self.__doc__ = getattr(self.body, "__doc__", "")
-            self.__name__ = getattr(self.body, "__name__", "")
-            self.__module__ = getattr(self.body, "__module__", "")
+            self._wrap(self.body)
 
+        # Validate option names in one go, up front
+        unknown = kwargs.keys() - _TASK_OPTIONS
+        if unknown:
+            raise TypeError(f"Unknown Task option(s): {sorted(unknown)}")
         # Default name, alternate names, and whether it should act as the
         # default for its parent collection
-        self._name: str = kwargs.pop("name", None)
-        self.aliases: tuple[str, ...] = tuple(kwargs.pop("aliases", ()))
-        self.is_default: bool = bool(kwargs.pop("default", False))
-        self.optional: tuple[str, ...] = tuple(kwargs.pop("optional", ()))
-        self.iterable: Iterable[str] = kwargs.pop("iterable", [])
-        self.incrementable: Iterable[str] = kwargs.pop("incrementable", [])
-        self.auto_shortflags: bool = bool(kwargs.pop("auto_shortflags", True))
-        self.help: dict[str, Any] = (kwargs.pop("help", {})).copy()
+        self._name: Optional[str] = kwargs.get("name")
+        self.aliases: tuple[str, ...] = tuple(kwargs.get("aliases", ()))
+        self.is_default: bool = bool(kwargs.get("default", False))
+        self.optional: tuple[str, ...] = tuple(kwargs.get("optional", ()))
+        self.iterable: Iterable[str] = kwargs.get("iterable", [])
+        self.incrementable: Iterable[str] = kwargs.get("incrementable", [])
+        self.auto_shortflags: bool = bool(kwargs.get("auto_shortflags", True))
+        # NOTE: copied, since get_arguments consumes it & it may be shared
+        # between tasks
+        self.help: dict[str, Any] = dict(kwargs.get("help") or {})
         # Call chain bidness
+        pre = kwargs.get("pre", [])
         if args:
             if "pre" in kwargs:
                 raise TypeError(
                     "May not give *args and 'pre' kwarg simultaneously!"
                 )
-            kwargs["pre"] = args
-        self.pre: list[Union[Call, Task]] = kwargs.pop("pre", [])
-        self.post: list[Union[Call, Task]] = kwargs.pop("post", [])
+            pre = args
+        self.pre: list[Union[Call, Task]] = pre
+        self.post: list[Union[Call, Task]] = kwargs.get("post", [])
         # Whether to print return value post-execution
-        self.autoprint: bool = bool(kwargs.pop("autoprint", False))
+        self.autoprint: bool = bool(kwargs.get("autoprint", False))
         # Arg/flag/parser hints
-        self.positional = (
-            self.fill_implicit_positionals(kwargs.pop("positional", None))
-            if self.body is not None
-            else kwargs.pop("positional", None)
-        )
-        kwargs.pop("klass", None)  # XXX move to metaclass
-        if kwargs != {}:
-            raise TypeError
+        self.positional: Optional[Iterable[str]] = kwargs.get("positional")
+        if self.body is not None:
+            self.positional = self.fill_implicit_positionals(self.positional)
+        self._index_arg_hints()
         self.times_called = 0
 
     def __repr__(self) -> str:
@@ -164,50 +202,66 @@ class Task:
         return f"<Task {self.name!r}{aliases}>"
 
     def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, Task) or self.name != other.name:
             return False
         # Functions do not define __eq__ but func_code objects apparently do.
         # (If we're wrapping some other callable, they will be responsible for
         # defining equality on their end.)
         if self.body:
-            if self.body == other.body:
+            if self.body is other.body or self.body == other.body:
                 return True
-            if hasattr(self.body, "__code__"):
-                return self.body.__code__ == other.body.__code__  # type: ignore
+            code = getattr(self.body, "__code__", None)
+            if code is not None:
+                return code == getattr(other.body, "__code__", None)
         return False
 
     def __hash__(self) -> int:
         # Presumes name and body will never be changed. Hrm.
         # Potentially cleaner to just not use Tasks as hash keys, but let's do
-        # this for now.
-        return hash(self.name) + hash(self.body)
+        # this for now. (Given that presumption, compute it just once.)
+        if self._hash is None:
+            self._hash = hash(self.name) + hash(self.body)
+        return self._hash
 
-    @singledispatchmethod
     def __call__(
         self, ctx: Union[Context, Callable], /, *args: Any, **kwargs: Any
     ) -> Optional[Any]:
+        # NOTE: dispatching by hand instead of via singledispatchmethod, since
+        # this runs for every task execution.
+        if isinstance(ctx, Context):
+            if self.body:
+                result = self.body(ctx, *args, **kwargs)
+                self.times_called += 1
+                return result
+            raise AttributeError("task body is undefined")
+        # Decorator form, i.e. @task(...) wrapping a body
+        if callable(ctx):
+            if self.body is None:
+                self._wrap(ctx)
+                self.body = ctx
+                self._hash = None
+                self._resolved_name = None
+                self.positional = self.fill_implicit_positionals(
+                    self.positional
+                )
+                self._index_arg_hints()
+            return self
         # TODO: raise a custom subclass _of_ TypeError instead
         raise TypeError(
             f"Task expected a Context as first arg, got {type(ctx)} instead!"
         )
 
-    @__call__.register
-    def _(self, ctx: Context, /, *args: Any, **kwargs: Any) -> Optional[Any]:
-        if self.body:
-            result = self.body(ctx, *args, **kwargs)
-            self.times_called += 1
-            return result
-        raise AttributeError("task body is undefined")
-
-    @__call__.register
-    def _(self, body: Callable, /, *args: Any, **kwargs: Any) -> Any:
-        # print('func', body, args, kwargs)
-        if self.body is None:
-            update_wrapper(self, body)  # type: ignore
-            self.body = body
-            self.positional = self.fill_implicit_positionals(self.positional)
-        # XXX: need to register "Task" somehow but singledispath cannot see it
-        return self
+    def _wrap(self, body: Callable) -> None:
+        # Appear as body for introspection/autodoc purposes. Set directly
+        # rather than via functools.update_wrapper, skipping its merge of the
+        # body's __dict__ into ours.
+        self.__doc__ = getattr(body, "__doc__", "")
+        self.__name__ = getattr(body, "__name__", "")
+        self.__qualname__ = getattr(body, "__qualname__", "")
+        self.__module__ = getattr(body, "__module__", "")
+        self.__wrapped__ = body
 
     @property
     def called(self) -> bool:
@@ -215,7 +269,11 @@ class Task:
 
     @property
     def name(self) -> str:
-        return self._name or self.__name__
+        # Looked up constantly (hashing, equality, collection binding) and
+        # fixed once there's a body, so resolve & intern it just once.
+        if self._resolved_name is None:
+            self._resolved_name = sys.intern(self._name or self.__name__)
+        return self._resolved_name
 
     def argspec(self, body: Callable) -> Signature:
         """
@@ -232,6 +290,10 @@ class Task:
             Changed from returning a two-tuple of ``(arg_names, spec_dict)`` to
             returning an `inspect.Signature`.
         """
+        # Signatures are immutable, so reuse the last one computed as long as
+        # it was for this same body.
+        if self._argspec is not None and self._argspec[0] is body:
+            return self._argspec[1]
         # Rebuild signature with first arg dropped, or die usefully(ish trying
         sig = inspect.signature(
             # Handle callable-but-not-function objects
@@ -245,7 +307,9 @@ class Task:
         if not params:
             # TODO: see TODO under __call__, this should be same type
             raise TypeError("Tasks must have an initial Context argument!")
-        return sig.replace(parameters=params[1:])
+        sig = sig.replace(parameters=params[1:])
+        self._argspec = (body, sig)
+        return sig
 
     def fill_implicit_positionals(
         self, positional: Optional[Iterable[str]]
@@ -255,30 +319,38 @@ class Task:
         # If positionals is None, everything lacking a default
         # value will be automatically considered positional.
         if positional is None:
-            positional = [
+            positional = tuple(
                 x.name
                 for x in self.argspec(self.body).parameters.values()
-                if x.default is inspect.Signature.empty
-            ]
+                if x.default is _EMPTY
+            )
         return positional
 
+    def _index_arg_hints(self) -> None:
+        # Set versions of the per-argument hints, for arg_opts' membership
+        # tests (which run once per argument).
+        self._positional_set = frozenset(self.positional or ())
+        self._optional_set = frozenset(self.optional)
+        self._iterable_set = frozenset(self.iterable)
+        self._incrementable_set = frozenset(self.incrementable)
+
     def arg_opts(
         self, name: str, default: str, taken_names: set[str]
     ) -> dict[str, Any]:
         opts: dict = {}
         # Whether it's positional or not
-        opts["positional"] = name in self.positional
+        opts["positional"] = name in self._positional_set
         # Whether it is a value-optional flag
-        opts["optional"] = name in self.optional
+        opts["optional"] = name in self._optional_set
         # Whether it should be of an iterable (list) kind
-        if name in self.iterable:
+        if name in self._iterable_set:
             opts["kind"] = list
             # If user gave a non-None default, hopefully they know better
             # than us what they want here (and hopefully it offers the list
             # protocol...) - otherwise supply useful default
             opts["default"] = default if default is not None else []
         # Whether it should increment its value or not
-        if name in self.incrementable:
+        if name in self._incrementable_set:
             opts["incrementable"] = True
         # Argument name(s) (replace w/ dashed version if underscores present,
         # and move the underscored version to be the attr_name instead.)
@@ -287,15 +359,16 @@ class Task:
             opts["attr_name"] = name
             name = translate_underscores(name)
         names = [name]
-        if self.auto_shortflags:
+        # Single-character names are their own shortflag already
+        if self.auto_shortflags and len(name) > 1:
             # Must know what short names are available
             for char in name:
-                if not (char == name or char in taken_names):
+                if char not in taken_names:
                     names.append(char)
                     break
         opts["names"] = names
         # Handle default value & kind if possible
-        if default not in (None, inspect.Signature.empty):
+        if default is not None and default is not _EMPTY:
             # TODO: allow setting 'kind' explicitly.
             # NOTE: skip setting 'kind' if optional is True + type(default) is
             # bool; that results in a nonsensical Argument which gives the
@@ -327,8 +400,24 @@ class Task:
         """
         if self.body is None:
             raise AttributeError("task body is undefined")
+        # The signature-derived Argument options don't change for a given
+        # body, so only work them out once; but always hand back fresh
+        # Arguments, as parsing stores values on them.
+        if self._arguments is None or self._arguments[0] is not self.body:
+            self._arguments = (self.body, self._argument_opts(self.body))
+        # If any values were leftover after consuming a 'help' dict, it implies
+        # the user messed up & had a typo or similar. Let's explode.
+        if self.help and not ignore_unknown_help:
+            raise ValueError(
+                "Help field was set for param(s) that don't exist: {}".format(
+                    list(self.help.keys())
+                )
+            )
+        return [Argument(**opts) for opts in self._arguments[1]]
+
+    def _argument_opts(self, body: Callable) -> list[dict[str, Any]]:
         # Core argspec
-        sig = self.argspec(self.body)
+        sig = self.argspec(body)
         # Prime the list of all already-taken names (mostly for help in
         # choosing auto shortflags)
         taken_names = set(sig.parameters.keys())
@@ -336,31 +425,24 @@ class Task:
         # etc)
         args = []
         for param in sig.parameters.values():
-            new_arg = Argument(
-                **self.arg_opts(param.name, param.default, taken_names)
-            )
-            args.append(new_arg)
+            opts = self.arg_opts(param.name, param.default, taken_names)
+            # Same canonical name Argument.name would give.
+            args.append((opts.get("attr_name") or opts["names"][0], opts))
             # Update taken_names list with new argument's full name list
             # (which may include new shortflags) so subsequent Argument
             # creation knows what's taken.
-            taken_names.update(set(new_arg.names))
-        # If any values were leftover after consuming a 'help' dict, it implies
-        # the user messed up & had a typo or similar. Let's explode.
-        if self.help and not ignore_unknown_help:
-            raise ValueError(
-                "Help field was set for param(s) that don't exist: {}".format(
-                    list(self.help.keys())
-                )
-            )
+            taken_names.update(opts["names"])
         # Now we need to ensure positionals end up in the front of the list, in
         # order given in self.positionals, so that when Context consumes them,
-        # this order is preserved.
-        for posarg in reversed(list(self.positional)):
-            for i, arg in enumerate(args):
-                if arg.name == posarg:
-                    args.insert(0, args.pop(i))
-                    break
-        return args
+        # this order is preserved. (Everything else keeps signature order.)
+        order: dict[str, int] = {}
+        for i, posarg in enumerate(self.positional or ()):
+            order.setdefault(posarg, i)
+        positionals = sorted(
+            (x for x in args if x[0] in order), key=lambda x: order[x[0]]
+        )
+        others = [x for x in args if x[0] not in order]
+        return [opts for _, opts in positionals + others]
 
 
 task = Task
@@ -377,6 +459,11 @@ class Call:
     .. versionadded:: 1.0
     """
 
+    # Calls get created (and cloned) for every pre/post task of every
+    # execution; skip the per-instance __dict__. (Subclasses still get one
+    # unless they declare their own slots.)
+    __slots__ = ("task", "called_as", "args", "kwargs")
+
     def __init__(
         self,
         task: Task,
@@ -410,6 +497,29 @@ class Call:
     def __getattr__(self, name: str) -> Any:
         return getattr(self.task, name)
 
+    # Explicit forwarding for the task attributes Executor reads off every
+    # call, sparing them the failed normal lookup before __getattr__.
+
+    @property
+    def name(self) -> str:
+        return self.task.name
+
+    @property
+    def body(self) -> Optional[Callable]:
+        return self.task.body
+
+    @property
+    def pre(self) -> list[Union[Call, Task]]:
+        return self.task.pre
+
+    @property
+    def post(self) -> list[Union[Call, Task]]:
+        return self.task.post
+
+    @property
+    def autoprint(self) -> bool:
+        return self.task.autoprint
+
     def __deepcopy__(self, memo: object) -> Call:
         return self.clone()
 
@@ -430,10 +540,13 @@ class Call:
         # same args/kwargs should be considered same as an unnamed call of the
         # same Task with the same args/kwargs (e.g. pre/post task specified w/o
         # name). Ditto tasks with multiple aliases.
-        for attr in "task args kwargs".split():
-            if getattr(self, attr) != getattr(other, attr):
-                return False
-        return True
+        if not isinstance(other, Call):
+            return False
+        return (
+            self.task == other.task
+            and self.args == other.args
+            and self.kwargs == other.kwargs
+        )
 
     def clone_data(self) -> dict:
         """
@@ -441,11 +554,27 @@ class Call:
 
         .. versionadded:: 1.1
         """
-        return {
-            "called_as": self.called_as,
-            "args": deepcopy(self.args),
-            "kwargs": deepcopy(self.kwargs),
-        }
+        memo: dict = {}
+        args: Any
+        kwargs: Any
+        if type(self.args) is tuple:
+            if all(type(x) in _ATOMIC_TYPES for x in self.args):
+                # Immutable all the way down, so it can simply be shared.
+                args = self.args
+            else:
+                args = tuple(_copy_item(x, memo) for x in self.args)
+        else:
+            args = deepcopy(self.args, memo)
+        if type(self.kwargs) is dict:
+            if all(type(x) in _ATOMIC_TYPES for x in self.kwargs.values()):
+                kwargs = self.kwargs.copy()
+            else:
+                kwargs = {
+                    k: _copy_item(v, memo) for k, v in self.kwargs.items()
+                }
+        else:
+            kwargs = deepcopy(self.kwargs, memo)
+        return {"called_as": self.called_as, "args": args, "kwargs": kwargs}
 
     def clone(
         self,
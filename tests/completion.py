@@ -120,6 +120,19 @@ class ShellCompletion:
                 test=_assert_contains,
             )
 
+    def binary_names_sharing_a_prefix_complete(self):
+        # 'inv' is a prefix of 'invoke'; whichever was typed gets stripped.
+        for used_binary in ("inv", "invoke"):
+            expect(
+                "{0} -c integration --complete -- {0} print-name --".format(
+                    used_binary
+                ),
+                program=Program(binary_names=["inv", "invoke"]),
+                invoke=False,
+                out="--name",
+                test=_assert_contains,
+            )
+
     def no_input_with_no_tasks_yields_empty_response(self):
         expect("-c empty --complete", out="")
 
@@ -72,7 +72,7 @@ class task_:
 
     def when_positional_arg_missing_all_non_default_args_are_positional(self):
         arg = self.vanilla["implicit_positionals"]
-        assert arg.positional == ["pos1", "pos2"]
+        assert arg.positional == ("pos1", "pos2")
 
     def context_arguments_should_not_appear_in_implicit_positional_list(self):
         @task
@@ -214,6 +214,19 @@ class Task_:
         def can_override_name(self):
             assert Task(_func, name="foo").name == "foo"
 
+    class argspec:
+        def is_reused_for_the_same_body(self):
+            t = Task(_func)
+            assert t.argspec(_func) is t.argspec(_func)
+
+        def is_recomputed_for_a_different_body(self):
+            def other(c, arg):
+                pass
+
+            t = Task(_func)
+            assert list(t.argspec(other).parameters) == ["arg"]
+            assert list(t.argspec(_func).parameters) == []
+
     class callability:
         def setup_method(self):
             @task
@@ -367,6 +380,11 @@ class Task_:
 
             assert len(mytask.get_arguments()) == 0
 
+        def repeat_calls_return_fresh_but_equivalent_arguments(self):
+            again = self.task.get_arguments()
+            assert [x.names for x in again] == [x.names for x in self.args]
+            assert all(x is not y for x, y in zip(again, self.args))
+
         def underscores_become_dashes(self):
             @task
             def mytask(c, longer_arg):
@@ -402,6 +420,14 @@ class Task_:
             def underscored_name_via_dashes(self):
                 assert self.help["with_dashes"] == "also yup"
 
+            def survives_repeat_calls(self):
+                @task(help={"simple": "key"})
+                def mytask(c, simple):
+                    pass
+
+                mytask.get_arguments()
+                assert mytask.get_arguments()[0].help == "key"
+
             def raises_ValueError_on_keys_not_found_in_task_args(self):
                 @task(help={"non-existing-param": "Help text"})
                 def no_parameters(c):
@@ -483,6 +509,22 @@ class Call_:
             def may_be_given(self):
                 assert Call(_, kwargs={"foo": "bar"}).kwargs == {"foo": "bar"}
 
+    class equality:
+        def compares_task_args_and_kwargs(self):
+            call = Call(self.task, args=(1,), kwargs={"a": 2})
+            assert call == Call(self.task, args=(1,), kwargs={"a": 2})
+            assert call != Call(self.task, args=(2,), kwargs={"a": 2})
+            assert call != Call(self.task, args=(1,), kwargs={"a": 3})
+
+        def ignores_called_as(self):
+            assert Call(self.task, called_as="foo") == Call(self.task)
+
+        def is_false_for_non_Call_objects(self):
+            assert Call(self.task) != self.task
+
+        def treats_empty_args_and_kwargs_as_omitted(self):
+            assert Call(self.task, args=[], kwargs={}) == Call(self.task)
+
     class stringrep:
         "__str__"
 
@@ -523,6 +565,20 @@ class Call_:
             assert clone is not orig
             assert clone == orig
 
+        def copies_mutable_args_and_kwargs(self):
+            orig = Call(self.task, args=("a", [1]), kwargs={"b": {"c": 2}})
+            clone = orig.clone()
+            assert clone == orig
+            assert clone.args[1] is not orig.args[1]
+            assert clone.kwargs["b"] is not orig.kwargs["b"]
+
+        def shares_immutable_args_but_not_kwargs_dict(self):
+            orig = Call(self.task, args=("a", 1), kwargs={"b": None})
+            clone = orig.clone()
+            assert clone.args is orig.args
+            assert clone.kwargs == orig.kwargs
+            assert clone.kwargs is not orig.kwargs
+
         def can_clone_into_a_subclass(self):
             orig = Call(self.task)
 